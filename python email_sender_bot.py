@@ -1,15 +1,614 @@
 import smtplib
+import asyncio
+import base64
+import socket
+import ssl
 import csv
+import heapq
+import io
+import itertools
 import os
+import re
+import atexit
 import logging
+import logging.handlers
+import random
+import string
 import time
+import queue
+import threading
+from email.generator import BytesGenerator
+from email import policy as email_policy
+from email.message import EmailMessage, Message
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Iterator, Tuple, Union
 import getpass
+import uuid
+
+try:
+    import pandas as pd  # Optional: vectorized CSV parsing for large recipient lists
+except ImportError:
+    pd = None
+
+try:
+    import aiosmtplib  # Optional: asyncio SMTP client for high-concurrency sends
+except ImportError:
+    aiosmtplib = None
+
+
+logger = logging.getLogger(__name__)
+
+# local@domain.tld with no whitespace or extra '@'; used with fullmatch
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+# Invalid rows quoted in the warning logged after loading a CSV
+MAX_SKIPPED_SAMPLES = 10
+
+# Concurrent SMTP sessions tolerated by common providers
+PROVIDER_MAX_CONCURRENCY = {
+    "smtp.gmail.com": 15,
+    "smtp.zoho.com": 5,
+}
+
+
+_FORMATTER = string.Formatter()
+
+# Pre-parsed template: (literal, field_name, format_spec, conversion) tuples
+TemplateParts = List[Tuple[str, Optional[str], Optional[str], Optional[str]]]
+
+
+def _compile_template(template: str) -> TemplateParts:
+    """Parse a str.format-style template once so it can be rendered many times."""
+    return list(_FORMATTER.parse(template))
+
+
+def _render(parts: TemplateParts, recipient: Dict) -> str:
+    """
+    Render pre-parsed template parts for one recipient.
+    
+    Plain `{field}` placeholders missing from the recipient render as an
+    empty string; attribute/index lookups, conversions and format specs
+    follow str.format semantics.
+    """
+    if not parts:
+        return ''
+    if len(parts) == 1 and parts[0][1] is None:
+        return parts[0][0]  # No placeholders: reuse the literal as-is
+    
+    chunks = []
+    for literal, field, format_spec, conversion in parts:
+        chunks.append(literal)
+        if field is None:
+            continue
+        
+        if field.isidentifier():
+            value = recipient.get(field, '')
+        else:
+            value = _FORMATTER.get_field(field, (), recipient)[0]
+        
+        if conversion:
+            value = _FORMATTER.convert_field(value, conversion)
+        chunks.append(format(value, format_spec) if format_spec else str(value))
+    
+    return ''.join(chunks)
+
+
+# Maximum base64 line length allowed in MIME bodies (RFC 2045)
+BASE64_LINE_LENGTH = 76
+_BASE64_LINE_RE = re.compile(b'.{1,%d}' % BASE64_LINE_LENGTH, re.DOTALL)
+
+
+# Raw bytes read per chunk; a multiple of 57 so each chunk encodes to whole lines
+ATTACHMENT_CHUNK_SIZE = 57 * 16384
+ATTACHMENT_BUFFER_SIZE = 1 << 20
+
+
+def _encode_base64_lines(data: bytes) -> bytes:
+    """Base64-encode `data` in one C call and wrap it into 76-column CRLF lines."""
+    encoded = base64.b64encode(data)
+    return b"\r\n".join(_BASE64_LINE_RE.findall(encoded))
+
+
+def _encode_base64_file(filepath: str) -> str:
+    """Base64-encode a file chunk by chunk without holding its raw bytes in memory."""
+    encoded = bytearray()
+    
+    with open(filepath, "rb", buffering=ATTACHMENT_BUFFER_SIZE) as attachment:
+        while True:
+            chunk = attachment.read(ATTACHMENT_CHUNK_SIZE)
+            if not chunk:
+                break
+            if encoded:
+                encoded += b"\r\n"
+            encoded += _encode_base64_lines(chunk)
+    
+    return encoded.decode('ascii')
+
+
+# SMTP reply codes worth retrying; any other 5xx reply is treated as permanent
+TRANSIENT_SMTP_CODES = {421, 450, 451, 452, 554}
+MAX_RETRIES = 3
+MAX_BACKOFF = 30.0
+# How long an idle worker waits for new work before checking scheduled retries
+RETRY_POLL_INTERVAL = 0.1
+
+
+def _backoff_delay(attempt: int, cap: float = MAX_BACKOFF) -> float:
+    """Exponential backoff with up to one second of random jitter."""
+    return min(cap, (2 ** attempt) + random.uniform(0, 1))
+
+
+def _smtp_code(error: Exception) -> Optional[int]:
+    """SMTP reply code carried by an smtplib or aiosmtplib error, if any."""
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code
+    if aiosmtplib is not None and isinstance(error, aiosmtplib.SMTPResponseException):
+        return error.code
+    return None
+
+
+def _is_transient_code(code: int) -> bool:
+    """Whether an SMTP reply code signals a temporary failure."""
+    return code in TRANSIENT_SMTP_CODES or 400 <= code < 500
+
+
+def _refused_codes(error: Exception) -> List[int]:
+    """Per-recipient reply codes of an smtplib or aiosmtplib SMTPRecipientsRefused."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return [code for code, _ in error.recipients.values()]
+    return [refusal.code for refusal in error.recipients]
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed send may succeed if retried."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused) or (
+            aiosmtplib is not None and isinstance(error, aiosmtplib.SMTPRecipientsRefused)):
+        # Retry only when every refusal is temporary, e.g. a greylisting 450 at RCPT
+        codes = _refused_codes(error)
+        return bool(codes) and all(_is_transient_code(code) for code in codes)
+    
+    code = _smtp_code(error)
+    if code is None:
+        return True  # Dropped connections, timeouts and other transport errors
+    return _is_transient_code(code)
+
+
+# Longest line allowed in a message, excluding CRLF (RFC 5322 section 2.1.1)
+MAX_LINE_LENGTH = 998
+# Policy for flat text messages: non-ASCII bodies are encoded rather than sent
+# as 8bit, which servers without 8BITMIME may reject or mangle
+TEXT_MESSAGE_POLICY = email_policy.default.clone(cte_type='7bit')
+
+
+class MessageByteTemplate:
+    """
+    A message serialized once with marker tokens standing in for the
+    recipient address and template fields. Personalizing it is a single
+    bytes join instead of a walk through the email package.
+    """
+    
+    def __init__(self, pieces: List[bytes], fields: List[str]):
+        """
+        Args:
+            pieces: Serialized message split around markers; odd entries are
+                placeholders filled from `fields` in order
+            fields: Recipient field for each placeholder
+        """
+        self.pieces = pieces
+        self.fields = fields
+        self.line_budgets = self._line_budgets(pieces)
+    
+    @staticmethod
+    def _line_budgets(pieces: List[bytes]) -> List[Tuple[int, List[int]]]:
+        """
+        For every line holding placeholders, the room left for their values
+        under MAX_LINE_LENGTH and the placeholder indexes on that line.
+        """
+        budgets = []
+        line_length = 0
+        on_line = []
+        
+        for n, piece in enumerate(pieces):
+            if n % 2:
+                on_line.append(n // 2)
+                continue
+            
+            lines = piece.split(b'\r\n')
+            line_length += len(lines[0])
+            if len(lines) > 1:
+                if on_line:
+                    budgets.append((MAX_LINE_LENGTH - line_length, on_line))
+                line_length = len(lines[-1])
+                on_line = []
+        
+        if on_line:
+            budgets.append((MAX_LINE_LENGTH - line_length, on_line))
+        return budgets
+    
+    def render(self, recipient: Dict) -> Optional[bytes]:
+        """
+        Return the message bytes for `recipient`, or None when a value can't
+        be spliced in verbatim (missing address, non-ASCII text, line breaks,
+        or a value that would push its line past MAX_LINE_LENGTH unfolded).
+        """
+        if not recipient.get('email'):
+            return None
+        
+        values = []
+        for field in self.fields:
+            value = str(recipient.get(field, ''))
+            if '\r' in value or '\n' in value:
+                return None
+            try:
+                values.append(value.encode('ascii'))
+            except UnicodeEncodeError:
+                return None
+        
+        for budget, indexes in self.line_budgets:
+            if sum(len(values[i]) for i in indexes) > budget:
+                return None
+        
+        pieces = list(self.pieces)
+        pieces[1::2] = values
+        return b''.join(pieces)
+
+
+class DelayedQueue:
+    """Thread-safe queue of items that only become available after a delay."""
+    
+    def __init__(self):
+        self.heap = []
+        self.counter = itertools.count()  # Tie-breaker so items are never compared
+        self.lock = threading.Lock()
+    
+    def put(self, item, delay: float):
+        """Schedule `item` to become available in `delay` seconds."""
+        with self.lock:
+            heapq.heappush(self.heap, (time.monotonic() + delay, next(self.counter), item))
+    
+    def pop_ready(self):
+        """Return the earliest item whose delay has elapsed, or None."""
+        with self.lock:
+            if self.heap and self.heap[0][0] <= time.monotonic():
+                return heapq.heappop(self.heap)[2]
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that bounds the overall send rate
+    shared by every worker.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: Tokens added per second (0 = unlimited)
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        if not self.rate:
+            return 0.0
+        
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def acquire(self):
+        """Block until a token is available."""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+class TLSSessionCache:
+    """
+    Shared SSL context that remembers the last negotiated TLS session,
+    so reconnects can resume it instead of running a full handshake.
+    
+    Passed to smtplib's starttls() in place of an SSLContext; only
+    wrap_socket() is used there.
+    """
+    
+    def __init__(self, context: ssl.SSLContext = None):
+        self.context = context or ssl.create_default_context()
+        self.session = None
+    
+    def wrap_socket(self, sock, server_hostname=None, **kwargs):
+        """Wrap `sock`, offering the cached session for resumption."""
+        return self.context.wrap_socket(sock, server_hostname=server_hostname,
+                                        session=self.session, **kwargs)
+    
+    def remember(self, sock):
+        """Cache the session of an established TLS socket."""
+        if isinstance(sock, ssl.SSLSocket) and sock.session is not None:
+            self.session = sock.session
+
+
+class PipeliningSMTP(smtplib.SMTP):
+    """
+    SMTP client that batches MAIL FROM, RCPT TO and DATA into a single
+    write when the server advertises PIPELINING (RFC 2920), then reads
+    the replies in order. Falls back to the standard command sequence
+    when the extension is missing.
+    
+    Outgoing data is buffered and only written, with one sendall(), when
+    a reply is about to be read. TCP_NODELAY is set so those coalesced
+    writes are not held back by Nagle's algorithm.
+    
+    When `server_addrs` (getaddrinfo() results) is given the socket
+    connects to those addresses, trying each in turn like
+    socket.create_connection(), while the host name is still used for
+    EHLO, SNI and certificate checks.
+    """
+    
+    def __init__(self, *args, server_addrs: List[tuple] = None, **kwargs):
+        self._write_buffer = bytearray()
+        self.server_addrs = server_addrs
+        super().__init__(*args, **kwargs)
+    
+    def _get_socket(self, host, port, timeout):
+        if self.server_addrs:
+            sock = self._connect_any(timeout)
+        else:
+            sock = super()._get_socket(host, port, timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+    
+    def _connect_any(self, timeout):
+        """Connect to the first reachable address in `server_addrs`."""
+        error = None
+        for family, socktype, proto, _, sockaddr in self.server_addrs:
+            sock = socket.socket(family, socktype, proto)
+            try:
+                if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                    sock.settimeout(timeout)
+                if self.source_address:
+                    sock.bind(self.source_address)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as e:
+                error = e
+                sock.close()
+        raise error
+    
+    def send(self, s):
+        """Queue `s` for the server; it is written before the next reply is read."""
+        if self.debuglevel > 0:
+            self._print_debug('send:', repr(s))
+        if not self.sock:
+            raise smtplib.SMTPServerDisconnected('please run connect() first')
+        if isinstance(s, str):
+            s = s.encode(self.command_encoding)
+        self._write_buffer += s
+    
+    def flush(self):
+        """Write all queued data to the server in a single call."""
+        if not self._write_buffer:
+            return
+        data, self._write_buffer = self._write_buffer, bytearray()
+        try:
+            self.sock.sendall(data)
+        except OSError:
+            self.close()
+            raise smtplib.SMTPServerDisconnected('Server not connected')
+    
+    def getreply(self):
+        self.flush()
+        return super().getreply()
+    
+    def close(self):
+        self._write_buffer = bytearray()
+        super().close()
+    
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        """Send a message, pipelining the envelope commands when supported."""
+        self.ehlo_or_helo_if_needed()
+        
+        if (not self.has_extn('pipelining') or not isinstance(msg, bytes)
+                or any(option.lower() == 'smtputf8' for option in mail_options)):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+        
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        
+        esmtp_opts = []
+        if self.has_extn('size'):
+            esmtp_opts.append("size=%d" % len(msg))
+        esmtp_opts.extend(mail_options)
+        
+        mail_args = ''.join(' ' + option for option in esmtp_opts)
+        rcpt_args = ''.join(' ' + option for option in rcpt_options)
+        commands = [f"mail FROM:{smtplib.quoteaddr(from_addr)}{mail_args}"]
+        commands.extend(f"rcpt TO:{smtplib.quoteaddr(addr)}{rcpt_args}" for addr in to_addrs)
+        commands.append("data")
+        
+        for command in commands:
+            if '\r' in command or '\n' in command:
+                raise ValueError(f"Command contains prohibited newline characters: {command!r}")
+        
+        self.send(smtplib.CRLF.join(commands) + smtplib.CRLF)
+        replies = [self._pipelined_reply() for _ in commands]
+        mail_reply, rcpt_replies, data_reply = replies[0], replies[1:-1], replies[-1]
+        
+        senderrs = {
+            addr: reply for addr, reply in zip(to_addrs, rcpt_replies)
+            if reply[0] not in (250, 251)
+        }
+        
+        if mail_reply[0] != 250 or len(senderrs) == len(to_addrs) or data_reply[0] != 354:
+            if data_reply[0] == 354:
+                # The server accepted DATA anyway; end it with an empty body
+                self.send(b"." + smtplib.bCRLF)
+                self._pipelined_reply()
+            self._reset_transaction()
+            
+            if mail_reply[0] != 250:
+                raise smtplib.SMTPSenderRefused(mail_reply[0], mail_reply[1], from_addr)
+            if len(senderrs) == len(to_addrs):
+                raise smtplib.SMTPRecipientsRefused(senderrs)
+            raise smtplib.SMTPDataError(*data_reply)
+        
+        body = re.sub(br'(?m)^\.', b'..', msg)
+        if not body.endswith(smtplib.bCRLF):
+            body += smtplib.bCRLF
+        self.send(body + b"." + smtplib.bCRLF)
+        
+        code, resp = self._pipelined_reply()
+        if code != 250:
+            self._reset_transaction()
+            raise smtplib.SMTPDataError(code, resp)
+        
+        return senderrs
+    
+    def _pipelined_reply(self):
+        """
+        Read one reply, closing the session if the server is shutting down.
+        
+        A 421 is raised as SMTPResponseException rather than
+        SMTPServerDisconnected so the code is kept and the retry backs off
+        instead of reconnecting straight away.
+        """
+        code, resp = self.getreply()
+        if code == 421:
+            self.close()
+            raise smtplib.SMTPResponseException(code, resp)
+        return code, resp
+    
+    def _reset_transaction(self):
+        """Abort the current mail transaction, ignoring a dropped connection."""
+        try:
+            self.rset()
+        except smtplib.SMTPServerDisconnected:
+            pass
+
+
+class SMTPConnection:
+    """
+    Persistent SMTP session reused across a batch of emails.
+    
+    The session is opened lazily on first use, re-opened after a drop,
+    and rotated after `messages_per_connection` sends to stay under
+    provider-side session limits.
+    """
+    
+    def __init__(self, bot: "EmailSenderBot", messages_per_connection: int = 100):
+        """
+        Args:
+            bot: Bot providing server settings and credentials
+            messages_per_connection: Sends before the session is rotated (0 = no cap)
+        """
+        self.bot = bot
+        self.messages_per_connection = messages_per_connection
+        self.server = None
+        self.sent = 0
+    
+    def get(self) -> smtplib.SMTP:
+        """Return a live, authenticated server, opening or rotating it as needed."""
+        if self.server is not None and self.messages_per_connection \
+                and self.sent >= self.messages_per_connection:
+            self.close()
+        
+        if self.server is None:
+            self.server = self.bot.open_smtp_connection()
+            self.sent = 0
+        
+        return self.server
+    
+    def send_message(self, msg: Message):
+        """Send a message over the persistent session."""
+        self.get().send_message(msg)
+        self.sent += 1
+    
+    def sendmail(self, from_addr: str, to_addrs: List[str], msg: bytes):
+        """Send an already serialized message over the persistent session."""
+        self.get().sendmail(from_addr, to_addrs, msg)
+        self.sent += 1
+    
+    def reset(self):
+        """Drop the session without QUIT so the next send reconnects."""
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+    
+    def close(self):
+        """Politely end the session."""
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except smtplib.SMTPException:
+            self.server.close()
+        self.server = None
+
+
+class AsyncSMTPConnection:
+    """
+    asyncio counterpart of SMTPConnection built on aiosmtplib.
+    """
+    
+    def __init__(self, bot: "EmailSenderBot", messages_per_connection: int = 100):
+        """
+        Args:
+            bot: Bot providing server settings and credentials
+            messages_per_connection: Sends before the session is rotated (0 = no cap)
+        """
+        self.bot = bot
+        self.messages_per_connection = messages_per_connection
+        self.client = None
+        self.sent = 0
+    
+    async def get(self) -> "aiosmtplib.SMTP":
+        """Return a live, authenticated client, opening or rotating it as needed."""
+        if self.client is not None and self.messages_per_connection \
+                and self.sent >= self.messages_per_connection:
+            await self.close()
+        
+        if self.client is None:
+            self.client = await self.bot.open_async_smtp_connection()
+            self.sent = 0
+        
+        return self.client
+    
+    async def send_message(self, msg: Message):
+        """Send a message over the persistent session."""
+        client = await self.get()
+        await client.send_message(msg)
+        self.sent += 1
+    
+    async def sendmail(self, from_addr: str, to_addrs: List[str], msg: bytes):
+        """Send an already serialized message over the persistent session."""
+        client = await self.get()
+        await client.sendmail(from_addr, to_addrs, msg)
+        self.sent += 1
+    
+    def reset(self):
+        """Drop the session without QUIT so the next send reconnects."""
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+    
+    async def close(self):
+        """Politely end the session."""
+        if self.client is None:
+            return
+        try:
+            await self.client.quit()
+        except aiosmtplib.SMTPException:
+            self.client.close()
+        self.client = None
 
 
 class EmailSenderBot:
@@ -30,25 +629,43 @@ class EmailSenderBot:
         self.smtp_port = smtp_port
         self.sender_email = None
         self.password = None
+        self.tls = TLSSessionCache()  # Built once so reconnects can resume TLS sessions
+        self.smtp_addrs = None  # Resolved once, see resolve_smtp_server()
         self.setup_logging()
         
     def setup_logging(self):
-        """Setup logging configuration."""
+        """
+        Setup logging configuration.
+        
+        Handlers are attached to the module logger once per process, so
+        every bot shares the same log file. File writes happen on a
+        background QueueListener thread so sending never blocks on disk.
+        """
+        self.logger = logger
+        if logger.handlers:
+            return
+        
         log_dir = "logs"
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
             
         log_file = os.path.join(log_dir, f"email_bot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        log_queue = queue.Queue()
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.addHandler(stream_handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
         
     def authenticate(self):
         """Securely authenticate with email service provider."""
@@ -74,18 +691,59 @@ class EmailSenderBot:
             self.logger.error("Authentication failed")
             return False
     
+    def resolve_smtp_server(self) -> List[tuple]:
+        """
+        Resolve the SMTP server's addresses once and reuse them for every
+        connection. All getaddrinfo() results are kept so an unreachable
+        address (e.g. IPv6 without a route) falls through to the next one.
+        """
+        if self.smtp_addrs is None:
+            self.smtp_addrs = socket.getaddrinfo(self.smtp_server, self.smtp_port,
+                                                 type=socket.SOCK_STREAM)
+        return self.smtp_addrs
+    
+    def open_smtp_connection(self) -> smtplib.SMTP:
+        """Open an SMTP connection, upgrade it to TLS and log in."""
+        try:
+            server = PipeliningSMTP(self.smtp_server, self.smtp_port,
+                                    server_addrs=self.resolve_smtp_server())
+        except OSError:
+            self.smtp_addrs = None  # The cached addresses may be stale; look them up again next time
+            raise
+        
+        try:
+            server.starttls(context=self.tls)
+            server.login(self.sender_email, self.password)
+        except Exception:
+            server.close()
+            raise
+        
+        self.tls.remember(server.sock)
+        return server
+    
+    async def open_async_smtp_connection(self) -> "aiosmtplib.SMTP":
+        """Open an aiosmtplib connection, upgrade it to TLS and log in."""
+        client = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port,
+                                 start_tls=True, tls_context=self.tls.context)
+        await client.connect()
+        try:
+            await client.login(self.sender_email, self.password)
+        except Exception:
+            client.close()
+            raise
+        return client
+    
     def test_connection(self) -> bool:
         """Test SMTP connection."""
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.password)
+            with self.open_smtp_connection():
+                pass
             return True
         except Exception as e:
             self.logger.error(f"Connection test failed: {str(e)}")
             return False
     
-    def read_recipients_from_csv(self, csv_file: str) -> List[Dict]:
+    def read_recipients_from_csv(self, csv_file: str, chunksize: int = 10_000) -> List[Dict]:
         """
         Read recipient list from CSV file.
         
@@ -94,6 +752,7 @@ class EmailSenderBot:
         
         Args:
             csv_file: Path to CSV file
+            chunksize: Rows parsed per batch
             
         Returns:
             List of recipient dictionaries
@@ -101,20 +760,8 @@ class EmailSenderBot:
         recipients = []
         
         try:
-            with open(csv_file, 'r', encoding='utf-8') as file:
-                csv_reader = csv.DictReader(file)
-                
-                for i, row in enumerate(csv_reader, 1):
-                    if 'email' not in row:
-                        self.logger.warning(f"Row {i}: Missing 'email' field, skipping")
-                        continue
-                    
-                    if not row['email'] or '@' not in row['email']:
-                        self.logger.warning(f"Row {i}: Invalid email '{row.get('email')}', skipping")
-                        continue
-                    
-                    recipients.append(row)
-                    self.logger.info(f"Loaded recipient: {row.get('email', 'Unknown')}")
+            for chunk in self.iter_recipients_from_csv(csv_file, chunksize):
+                recipients.extend(chunk)
             
             self.logger.info(f"Successfully loaded {len(recipients)} recipients from {csv_file}")
             return recipients
@@ -126,41 +773,178 @@ class EmailSenderBot:
             self.logger.error(f"Error reading CSV file: {str(e)}")
             return []
     
-    def create_email_message(self, recipient: Dict, subject: str, 
-                            body_template: str, attachments: List[str] = None) -> Optional[MIMEMultipart]:
+    def iter_recipients_from_csv(self, csv_file: str, chunksize: int = 10_000) -> Iterator[List[Dict]]:
+        """
+        Stream valid recipients from a CSV file in batches.
+        
+        Uses pandas' C parser when pandas is installed, falling back to
+        the csv module otherwise. Rows whose email is not shaped like
+        local@domain.tld are skipped.
+        
+        Args:
+            csv_file: Path to CSV file
+            chunksize: Rows parsed per batch
+            
+        Yields:
+            Lists of recipient dictionaries
+        """
+        # Count every invalid row but only keep a few (row, email) samples
+        skipped = {'count': 0, 'samples': []}
+        
+        if pd is None:
+            yield from self._iter_recipients_csv_module(csv_file, chunksize, skipped)
+        else:
+            yield from self._iter_recipients_pandas(csv_file, chunksize, skipped)
+        
+        if skipped['count']:
+            preview = ", ".join(f"row {i} ('{email}')" for i, email in skipped['samples'])
+            extra = skipped['count'] - len(skipped['samples'])
+            more = f" and {extra} more" if extra else ""
+            self.logger.warning("Skipped %d invalid rows: %s%s", skipped['count'], preview, more)
+    
+    def _iter_recipients_pandas(self, csv_file: str, chunksize: int,
+                                skipped: Dict) -> Iterator[List[Dict]]:
+        """
+        Stream valid recipients in batches using pandas.read_csv.
+        
+        pandas rejects rows with more fields than the header, so on a parse
+        error the rest of the file is read with the csv module, which (like
+        csv.DictReader) ignores the extra fields.
+        """
+        rows_read = 0
+        
+        try:
+            for df in pd.read_csv(csv_file, chunksize=chunksize, dtype=str,
+                                  na_filter=False, index_col=False):
+                if 'email' not in df.columns:
+                    self.logger.warning("Missing 'email' field in CSV header, skipping all rows")
+                    return
+                
+                rows_read += len(df)
+                yield self._valid_recipients(df, skipped)
+        except pd.errors.ParserError as e:
+            self.logger.warning(f"Falling back to the csv module after row {rows_read}: {str(e).strip()}")
+            yield from self._iter_recipients_csv_module(csv_file, chunksize, skipped,
+                                                        skip_records=rows_read)
+    
+    def _valid_recipients(self, df: "pd.DataFrame", skipped: Dict) -> List[Dict]:
+        """Records of a pandas chunk with a valid email, counting the rest as skipped."""
+        mask = df['email'].str.fullmatch(_EMAIL_RE.pattern)
+        bad = ~mask
+        num_bad = int(bad.sum())
+        if num_bad:
+            skipped['count'] += num_bad
+            room = MAX_SKIPPED_SAMPLES - len(skipped['samples'])
+            if room > 0:
+                samples = df.loc[bad, 'email'].head(room)
+                skipped['samples'].extend(zip(samples.index + 1, samples))
+        
+        return df[mask].to_dict(orient='records')
+    
+    def _iter_recipients_csv_module(self, csv_file: str, chunksize: int, skipped: Dict,
+                                    skip_records: int = 0) -> Iterator[List[Dict]]:
+        """
+        Stream valid recipients in batches using csv.reader.
+        
+        The first `skip_records` non-empty data rows are passed over, for
+        resuming after the pandas reader gave up.
+        """
+        with open(csv_file, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            headers = next(reader, None)
+            
+            if headers is None:
+                return
+            if 'email' not in headers:
+                self.logger.warning("Missing 'email' field in CSV header, skipping all rows")
+                return
+            
+            email_idx = headers.index('email')
+            is_valid_email = _EMAIL_RE.fullmatch
+            chunk = []
+            append = chunk.append
+            
+            for i, row in enumerate(reader, 1):
+                if not row:
+                    continue
+                if skip_records:
+                    skip_records -= 1
+                    continue
+                
+                email = row[email_idx] if email_idx < len(row) else None
+                if not email or not is_valid_email(email):
+                    skipped['count'] += 1
+                    if len(skipped['samples']) < MAX_SKIPPED_SAMPLES:
+                        skipped['samples'].append((i, email))
+                    continue
+                
+                append(dict(zip(headers, row)))
+                
+                if len(chunk) >= chunksize:
+                    yield chunk
+                    chunk = []
+                    append = chunk.append
+            
+            if chunk:
+                yield chunk
+    
+    def create_email_message(self, recipient: Dict, subject: Union[str, TemplateParts],
+                            body_template: Union[str, TemplateParts],
+                            attachments: List[str] = None,
+                            attachment_parts: List[MIMEBase] = None,
+                            skeleton: MIMEMultipart = None) -> Optional[Message]:
         """
         Create a personalized email message with attachments.
         
+        Messages without attachments are built as a flat text
+        EmailMessage instead of a multipart container.
+        
         Args:
             recipient: Recipient dictionary with email and other fields
-            subject: Email subject (can include placeholders like {name})
-            body_template: Email body template (can include placeholders)
+            subject: Email subject (can include placeholders like {name}),
+                raw or pre-parsed with _compile_template
+            body_template: Email body template (can include placeholders),
+                raw or pre-parsed with _compile_template
             attachments: List of file paths to attach
+            attachment_parts: Encoded parts from prepare_attachments, reused
+                as-is instead of re-reading `attachments`
+            skeleton: Shared message from build_message_skeleton; when given,
+                `attachments` and `attachment_parts` are ignored
             
         Returns:
-            MIME message object or None if creation fails
+            Email message object or None if creation fails
         """
         try:
             # Personalize subject and body
-            personalized_subject = subject.format(**recipient)
-            personalized_body = body_template.format(**recipient)
+            if isinstance(subject, str):
+                subject = _compile_template(subject)
+            if isinstance(body_template, str):
+                body_template = _compile_template(body_template)
             
-            # Create message container
+            personalized_subject = _render(subject, recipient)
+            personalized_body = _render(body_template, recipient)
+            
+            if skeleton is None:
+                if attachment_parts is None:
+                    attachment_parts = self.prepare_attachments(attachments)
+                skeleton = self.build_message_skeleton(attachment_parts)
+            
+            if not skeleton.get_payload():
+                msg = EmailMessage(policy=TEXT_MESSAGE_POLICY)
+                msg['From'] = self.sender_email
+                msg['To'] = recipient['email']
+                msg['Subject'] = personalized_subject
+                msg.set_content(personalized_body)
+                return msg
+            
+            # Fresh container per recipient; the encoded attachment parts are shared
             msg = MIMEMultipart()
-            msg['From'] = self.sender_email
+            msg['From'] = skeleton['From']
             msg['To'] = recipient['email']
             msg['Subject'] = personalized_subject
             
-            # Add body
-            msg.attach(MIMEText(personalized_body, 'plain'))
-            
-            # Add attachments
-            if attachments:
-                for attachment_path in attachments:
-                    if os.path.exists(attachment_path):
-                        self.attach_file(msg, attachment_path)
-                    else:
-                        self.logger.warning(f"Attachment not found: {attachment_path}")
+            # Body first, followed by the shared attachment parts
+            msg.set_payload([MIMEText(personalized_body, 'plain')] + skeleton.get_payload())
             
             return msg
             
@@ -168,34 +952,149 @@ class EmailSenderBot:
             self.logger.error(f"Error creating message for {recipient.get('email')}: {str(e)}")
             return None
     
-    def attach_file(self, msg: MIMEMultipart, filepath: str):
-        """Attach a file to the email message."""
+    def build_message_skeleton(self, attachment_parts: List[MIMEBase]) -> MIMEMultipart:
+        """
+        Build the recipient-independent part of a message (From header and
+        attachments) whose parts create_email_message shares across recipients.
+        """
+        skeleton = MIMEMultipart()
+        skeleton['From'] = self.sender_email
+        
+        for part in attachment_parts:
+            skeleton.attach(part)
+        
+        return skeleton
+    
+    def build_byte_template(self, subject: TemplateParts, body_template: TemplateParts,
+                            skeleton: MIMEMultipart) -> Optional[MessageByteTemplate]:
+        """
+        Serialize the batch's message once with marker tokens in place of
+        every placeholder, for templates that can be personalized by
+        splicing bytes.
+        
+        Returns:
+            Byte template, or None if the templates use format specs,
+            conversions, compound field names or non-ASCII text
+        """
+        fields = ['email']
+        expected = ['email']  # One entry per placeholder, plus the To header
+        for literal, field, format_spec, conversion in subject + body_template:
+            try:
+                literal.encode('ascii')
+            except UnicodeEncodeError:
+                return None
+            if field is None:
+                continue
+            if not field.isidentifier() or format_spec or conversion:
+                return None
+            expected.append(field)
+            if field not in fields:
+                fields.append(field)
+        
+        # Kept short so markers don't push body lines into quoted-printable
+        nonce = uuid.uuid4().hex[:16]
+        markers = {field: f"x{nonce}f{i}" for i, field in enumerate(fields)}
+        markers['email'] = f"x{nonce}@example.invalid"
+        
+        msg = self.create_email_message(markers, subject, body_template, skeleton=skeleton)
+        if msg is None:
+            return None
+        
+        text_part = msg.get_payload(0) if msg.is_multipart() else msg
+        if text_part['Content-Transfer-Encoding'] != '7bit':
+            return None  # Markers would not survive quoted-printable/base64
+        
+        # Headers are written unfolded so no marker is split or RFC 2047
+        # encoded; MessageByteTemplate enforces the line length limit instead
+        with io.BytesIO() as raw:
+            BytesGenerator(raw, policy=msg.policy.clone(max_line_length=None)).flatten(
+                msg, linesep='\r\n')
+            data = raw.getvalue()
+        
+        by_marker = {markers[field].encode('ascii'): field for field in fields}
+        pattern = re.compile(b'(' + b'|'.join(re.escape(marker) for marker in by_marker) + b')')
+        pieces = pattern.split(data)
+        placeholders = [by_marker[marker] for marker in pieces[1::2]]
+        
+        # Give up if any marker was mangled during serialization
+        if sorted(placeholders) != sorted(expected):
+            return None
+        if any(nonce.encode('ascii') in piece for piece in pieces[0::2]):
+            return None
+        
+        return MessageByteTemplate(pieces, placeholders)
+    
+    def _message_for(self, recipient: Dict, subject: TemplateParts, body_template: TemplateParts,
+                     skeleton: MIMEMultipart,
+                     byte_template: Optional[MessageByteTemplate]) -> Union[Message, bytes, None]:
+        """Personalized message for one recipient, as raw bytes when the byte template applies."""
+        if byte_template is not None:
+            data = byte_template.render(recipient)
+            if data is not None:
+                return data
+        return self.create_email_message(recipient, subject, body_template, skeleton=skeleton)
+    
+    def prepare_attachments(self, attachments: Optional[List[str]]) -> List[MIMEBase]:
+        """
+        Read and encode attachment files once so the resulting parts can
+        be shared by every message in a batch.
+        
+        Args:
+            attachments: List of file paths to attach
+            
+        Returns:
+            List of encoded MIME parts (missing or unreadable files are skipped)
+        """
+        parts = []
+        
+        for attachment_path in attachments or []:
+            if not os.path.exists(attachment_path):
+                self.logger.warning(f"Attachment not found: {attachment_path}")
+                continue
+            
+            part = self.build_attachment_part(attachment_path)
+            if part is not None:
+                parts.append(part)
+        
+        return parts
+    
+    def build_attachment_part(self, filepath: str) -> Optional[MIMEBase]:
+        """Read a file into a base64-encoded MIME attachment part."""
         try:
             filename = os.path.basename(filepath)
             
-            with open(filepath, "rb") as attachment:
-                part = MIMEBase("application", "octet-stream")
-                part.set_payload(attachment.read())
-            
-            encoders.encode_base64(part)
+            part = MIMEBase("application", "octet-stream")
+            part.set_payload(_encode_base64_file(filepath))
+            part['Content-Transfer-Encoding'] = 'base64'
             part.add_header(
                 "Content-Disposition",
                 f"attachment; filename= {filename}",
             )
             
-            msg.attach(part)
             self.logger.info(f"Attached: {filename}")
+            return part
             
         except Exception as e:
             self.logger.error(f"Failed to attach {filepath}: {str(e)}")
+            return None
     
-    def send_email_with_retry(self, msg: MIMEMultipart, recipient_email: str, 
-                             max_retries: int = 3) -> bool:
+    def attach_file(self, msg: MIMEMultipart, filepath: str):
+        """Attach a file to the email message."""
+        part = self.build_attachment_part(filepath)
+        if part is not None:
+            msg.attach(part)
+    
+    def send_email_with_retry(self, connection: SMTPConnection, msg: Union[Message, bytes],
+                             recipient_email: str, max_retries: int = MAX_RETRIES) -> bool:
         """
         Send email with retry logic.
         
+        Transient failures are retried with jittered exponential backoff;
+        permanent rejections fail immediately.
+        
         Args:
-            msg: Email message object
+            connection: Persistent SMTP connection to send over
+            msg: Email message object, or serialized message bytes
             recipient_email: Recipient's email address
             max_retries: Maximum number of retry attempts
             
@@ -203,42 +1102,80 @@ class EmailSenderBot:
             True if sent successfully, False otherwise
         """
         for attempt in range(max_retries):
-            try:
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    server.starttls()
-                    server.login(self.sender_email, self.password)
-                    server.send_message(msg)
-                
-                self.logger.info(f"✓ Email sent successfully to {recipient_email}")
-                return True
-                
-            except smtplib.SMTPRecipientsRefused:
-                self.logger.error(f"Recipient refused: {recipient_email}")
-                return False
-            except smtplib.SMTPSenderRefused:
-                self.logger.error(f"Sender refused. Check authentication.")
-                return False
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    self.logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries} failed for {recipient_email}. "
-                        f"Retrying in {wait_time} seconds... Error: {str(e)}"
-                    )
-                    time.sleep(wait_time)
+            sent, error = self._attempt_send(connection, msg, recipient_email)
+            if error is None:
+                return sent
+            
+            if attempt < max_retries - 1:
+                if isinstance(error, smtplib.SMTPServerDisconnected) and attempt == 0:
+                    wait_time = 0  # Stale session, reconnect straight away
                 else:
-                    self.logger.error(
-                        f"Failed to send to {recipient_email} after {max_retries} attempts. "
-                        f"Error: {str(e)}"
-                    )
+                    wait_time = _backoff_delay(attempt)
+                self.logger.warning(
+                    f"Attempt {attempt + 1}/{max_retries} failed for {recipient_email}. "
+                    f"Retrying in {wait_time:.1f} seconds... Error: {str(error)}"
+                )
+                time.sleep(wait_time)
+            else:
+                self.logger.error(
+                    f"Failed to send to {recipient_email} after {max_retries} attempts. "
+                    f"Error: {str(error)}"
+                )
         
         return False
     
+    def _attempt_send(self, connection: SMTPConnection, msg: Union[Message, bytes],
+                      recipient_email: str) -> Tuple[bool, Optional[Exception]]:
+        """
+        Make a single delivery attempt.
+        
+        Returns:
+            (sent, error) where `error` is set only for transient failures
+            that are worth retrying
+        """
+        try:
+            if isinstance(msg, bytes):
+                connection.sendmail(self.sender_email, [recipient_email], msg)
+            else:
+                connection.send_message(msg)
+            
+            self.logger.debug("✓ Email sent successfully to %s", recipient_email)
+            return True, None
+            
+        except smtplib.SMTPRecipientsRefused as e:
+            if 421 in _refused_codes(e):
+                connection.reset()
+            if _is_transient(e):
+                return False, e
+            self.logger.error(f"Recipient refused: {recipient_email}")
+            return False, None
+        except smtplib.SMTPSenderRefused as e:
+            if e.smtp_code == 421:
+                connection.reset()
+            if _is_transient(e):
+                return False, e
+            self.logger.error(f"Sender refused. Check authentication.")
+            return False, None
+        except Exception as e:
+            # Reconnect on the next attempt unless the server cleanly rejected the message
+            if not isinstance(e, smtplib.SMTPResponseException) or e.smtp_code == 421:
+                connection.reset()
+            
+            if not _is_transient(e):
+                self.logger.error(f"Permanent failure for {recipient_email}: {str(e)}")
+                return False, None
+            return False, e
+    
     def send_bulk_emails(self, recipients: List[Dict], subject: str, 
                         body_template: str, attachments: List[str] = None,
-                        delay: float = 1.0) -> Dict:
+                        delay: float = 1.0, messages_per_connection: int = 100,
+                        concurrency: int = 1) -> Dict:
         """
-        Send bulk emails to all recipients.
+        Send bulk emails to all recipients over a single persistent connection.
+        
+        With `concurrency` > 1 the batch is delegated to
+        send_bulk_emails_async when aiosmtplib is installed, or to the
+        threaded send_bulk_emails_concurrent otherwise.
         
         Args:
             recipients: List of recipient dictionaries
@@ -246,10 +1183,20 @@ class EmailSenderBot:
             body_template: Email body template
             attachments: List of attachment file paths
             delay: Delay between emails (seconds)
+            messages_per_connection: Sends before the SMTP session is rotated
+            concurrency: Number of parallel SMTP sessions
             
         Returns:
             Dictionary with send statistics
         """
+        if concurrency > 1:
+            kwargs = dict(attachments=attachments, delay=delay, concurrency=concurrency,
+                          messages_per_connection=messages_per_connection)
+            if aiosmtplib is not None:
+                return asyncio.run(self.send_bulk_emails_async(recipients, subject,
+                                                               body_template, **kwargs))
+            return self.send_bulk_emails_concurrent(recipients, subject, body_template, **kwargs)
+        
         stats = {
             'total': len(recipients),
             'success': 0,
@@ -261,32 +1208,356 @@ class EmailSenderBot:
         print("SENDING EMAILS")
         print("="*50)
         
-        for i, recipient in enumerate(recipients, 1):
-            recipient_email = recipient.get('email', 'Unknown')
-            
-            print(f"\n[{i}/{len(recipients)}] Processing: {recipient_email}")
+        # Parse templates and build the shared message once for the whole batch
+        subject = _compile_template(subject)
+        body_template = _compile_template(body_template)
+        skeleton = self.build_message_skeleton(self.prepare_attachments(attachments))
+        byte_template = self.build_byte_template(subject, body_template, skeleton)
+        
+        connection = SMTPConnection(self, messages_per_connection)
+        
+        try:
+            for i, recipient in enumerate(recipients, 1):
+                recipient_email = recipient.get('email', 'Unknown')
+                
+                print(f"\n[{i}/{len(recipients)}] Processing: {recipient_email}")
+                
+                # Create personalized message
+                msg = self._message_for(recipient, subject, body_template,
+                                        skeleton, byte_template)
+                
+                if not msg:
+                    stats['failed'] += 1
+                    stats['failed_recipients'].append(recipient_email)
+                    continue
+                
+                # Send with retry logic
+                if self.send_email_with_retry(connection, msg, recipient_email):
+                    stats['success'] += 1
+                else:
+                    stats['failed'] += 1
+                    stats['failed_recipients'].append(recipient_email)
+                
+                # Delay between emails to avoid rate limiting
+                if i < len(recipients):
+                    time.sleep(delay)
+        finally:
+            connection.close()
+        
+        self.logger.info(f"Sent {stats['success']}/{stats['total']} emails ({stats['failed']} failed)")
+        return stats
+    
+    def send_bulk_emails_concurrent(self, recipients: List[Dict], subject: str,
+                                    body_template: str, attachments: List[str] = None,
+                                    delay: float = 1.0, concurrency: int = 5,
+                                    messages_per_connection: int = 100) -> Dict:
+        """
+        Send bulk emails using a pool of workers, each owning its own
+        persistent SMTP connection.
+        
+        Args:
+            recipients: List of recipient dictionaries
+            subject: Email subject template
+            body_template: Email body template
+            attachments: List of attachment file paths
+            delay: Average delay between emails across all workers (seconds)
+            concurrency: Number of parallel SMTP sessions
+            messages_per_connection: Sends before a worker's session is rotated
             
-            # Create personalized message
-            msg = self.create_email_message(recipient, subject, body_template, attachments)
+        Returns:
+            Dictionary with send statistics
+        """
+        stats = {
+            'total': len(recipients),
+            'success': 0,
+            'failed': 0,
+            'failed_recipients': []
+        }
+        
+        concurrency = self._cap_concurrency(concurrency, len(recipients))
+        
+        print("\n" + "="*50)
+        print(f"SENDING EMAILS ({concurrency} workers)")
+        print("="*50)
+        
+        # Parse templates and build the shared message once for the whole batch
+        subject = _compile_template(subject)
+        body_template = _compile_template(body_template)
+        skeleton = self.build_message_skeleton(self.prepare_attachments(attachments))
+        byte_template = self.build_byte_template(subject, body_template, skeleton)
+        
+        tasks = queue.Queue()
+        retries = DelayedQueue()
+        results = queue.Queue()
+        bucket = TokenBucket(1.0 / delay if delay > 0 else 0)
+        done = threading.Event()
+        
+        for recipient in recipients:
+            tasks.put(recipient)
+        
+        workers = [
+            threading.Thread(
+                target=self._send_worker,
+                args=(tasks, retries, results, bucket, done, subject, body_template,
+                      skeleton, byte_template, messages_per_connection),
+                daemon=True,
+            )
+            for _ in range(concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        for i in range(1, len(recipients) + 1):
+            recipient_email, sent = results.get()
+            print(f"\n[{i}/{len(recipients)}] {'Sent' if sent else 'Failed'}: {recipient_email}")
             
-            if not msg:
+            if sent:
+                stats['success'] += 1
+            else:
                 stats['failed'] += 1
                 stats['failed_recipients'].append(recipient_email)
-                continue
+        
+        done.set()
+        for worker in workers:
+            worker.join()
+        
+        self.logger.info(f"Sent {stats['success']}/{stats['total']} emails ({stats['failed']} failed)")
+        return stats
+    
+    async def send_bulk_emails_async(self, recipients: List[Dict], subject: str,
+                                     body_template: str, attachments: List[str] = None,
+                                     delay: float = 1.0, concurrency: int = 5,
+                                     messages_per_connection: int = 100) -> Dict:
+        """
+        Send bulk emails concurrently on a single asyncio event loop
+        using a pool of aiosmtplib connections.
+        
+        Args:
+            recipients: List of recipient dictionaries
+            subject: Email subject template
+            body_template: Email body template
+            attachments: List of attachment file paths
+            delay: Average delay between emails across all sends (seconds)
+            concurrency: Number of parallel SMTP sessions
+            messages_per_connection: Sends before a session is rotated
             
-            # Send with retry logic
-            if self.send_email_with_retry(msg, recipient_email):
+        Returns:
+            Dictionary with send statistics
+        """
+        if aiosmtplib is None:
+            raise RuntimeError("send_bulk_emails_async requires aiosmtplib (pip install aiosmtplib)")
+        
+        stats = {
+            'total': len(recipients),
+            'success': 0,
+            'failed': 0,
+            'failed_recipients': []
+        }
+        
+        concurrency = self._cap_concurrency(concurrency, len(recipients))
+        
+        print("\n" + "="*50)
+        print(f"SENDING EMAILS ({concurrency} async connections)")
+        print("="*50)
+        
+        # Parse templates and build the shared message once for the whole batch
+        subject = _compile_template(subject)
+        body_template = _compile_template(body_template)
+        skeleton = self.build_message_skeleton(self.prepare_attachments(attachments))
+        byte_template = self.build_byte_template(subject, body_template, skeleton)
+        
+        bucket = TokenBucket(1.0 / delay if delay > 0 else 0)
+        semaphore = asyncio.Semaphore(concurrency)
+        connections = [AsyncSMTPConnection(self, messages_per_connection) for _ in range(concurrency)]
+        pool = asyncio.Queue()
+        for connection in connections:
+            pool.put_nowait(connection)
+        
+        # Log every connection in up front; failures reconnect lazily on first send
+        await asyncio.gather(*(connection.get() for connection in connections),
+                             return_exceptions=True)
+        
+        async def send_one(recipient: Dict) -> bool:
+            return await self._send_async_with_retry(
+                pool, bucket, semaphore,
+                lambda: self._message_for(recipient, subject, body_template,
+                                          skeleton, byte_template),
+                recipient.get('email', 'Unknown'),
+            )
+        
+        try:
+            results = await asyncio.gather(*(send_one(recipient) for recipient in recipients),
+                                           return_exceptions=True)
+        finally:
+            await asyncio.gather(*(connection.close() for connection in connections),
+                                 return_exceptions=True)
+        
+        for i, (recipient, sent) in enumerate(zip(recipients, results), 1):
+            recipient_email = recipient.get('email', 'Unknown')
+            if isinstance(sent, Exception):
+                self.logger.error(f"Unexpected error for {recipient_email}: {str(sent)}")
+                sent = False
+            
+            print(f"\n[{i}/{len(recipients)}] {'Sent' if sent else 'Failed'}: {recipient_email}")
+            
+            if sent:
                 stats['success'] += 1
             else:
                 stats['failed'] += 1
                 stats['failed_recipients'].append(recipient_email)
-            
-            # Delay between emails to avoid rate limiting
-            if i < len(recipients):
-                time.sleep(delay)
         
+        self.logger.info(f"Sent {stats['success']}/{stats['total']} emails ({stats['failed']} failed)")
         return stats
     
+    async def _send_async_with_retry(self, pool: asyncio.Queue, bucket: TokenBucket,
+                                     semaphore: asyncio.Semaphore,
+                                     build_message: Callable[[], Union[Message, bytes, None]],
+                                     recipient_email: str) -> bool:
+        """
+        Send one message over a pooled aiosmtplib connection with retry logic.
+        
+        `semaphore` is held only for the duration of each attempt, so a
+        recipient waiting out its backoff does not take a slot away from
+        the rest of the batch. The message is built on the first attempt.
+        """
+        msg = None
+        for attempt in range(MAX_RETRIES):
+            async with semaphore:
+                if msg is None:
+                    msg = build_message()
+                    if not msg:
+                        return False
+                sent, error = await self._attempt_send_async(pool, bucket, msg, recipient_email)
+            
+            if error is None:
+                return sent
+            
+            if attempt < MAX_RETRIES - 1:
+                wait_time = _backoff_delay(attempt)
+                self.logger.warning(
+                    f"Attempt {attempt + 1}/{MAX_RETRIES} failed for {recipient_email}. "
+                    f"Retrying in {wait_time:.1f} seconds... Error: {str(error)}"
+                )
+                await asyncio.sleep(wait_time)
+        
+        self.logger.error(
+            f"Failed to send to {recipient_email} after {MAX_RETRIES} attempts. "
+            f"Error: {str(error)}"
+        )
+        return False
+    
+    async def _attempt_send_async(self, pool: asyncio.Queue, bucket: TokenBucket,
+                                  msg: Union[Message, bytes],
+                                  recipient_email: str) -> Tuple[bool, Optional[Exception]]:
+        """
+        Make a single delivery attempt over a pooled aiosmtplib connection.
+        
+        Returns:
+            (sent, error) where `error` is set only for transient failures
+            that are worth retrying
+        """
+        await asyncio.sleep(bucket.reserve())
+        connection = await pool.get()
+        
+        try:
+            if isinstance(msg, bytes):
+                await connection.sendmail(self.sender_email, [recipient_email], msg)
+            else:
+                await connection.send_message(msg)
+            self.logger.debug("✓ Email sent successfully to %s", recipient_email)
+            return True, None
+        except aiosmtplib.SMTPRecipientsRefused as e:
+            if 421 in _refused_codes(e):
+                connection.reset()
+            if _is_transient(e):
+                return False, e
+            self.logger.error(f"Recipient refused: {recipient_email}")
+            return False, None
+        except aiosmtplib.SMTPSenderRefused as e:
+            if e.code == 421:
+                connection.reset()
+            if _is_transient(e):
+                return False, e
+            self.logger.error(f"Sender refused. Check authentication.")
+            return False, None
+        except Exception as e:
+            if _smtp_code(e) in (None, 421):
+                connection.reset()
+            if not _is_transient(e):
+                self.logger.error(f"Permanent failure for {recipient_email}: {str(e)}")
+                return False, None
+            return False, e
+        finally:
+            pool.put_nowait(connection)
+    
+    def _cap_concurrency(self, concurrency: int, num_recipients: int) -> int:
+        """Limit concurrency to what the provider allows and the batch needs."""
+        max_concurrency = PROVIDER_MAX_CONCURRENCY.get(self.smtp_server.lower())
+        if max_concurrency and concurrency > max_concurrency:
+            self.logger.warning(
+                f"{self.smtp_server} allows at most {max_concurrency} concurrent sessions, "
+                f"capping workers at {max_concurrency}"
+            )
+            concurrency = max_concurrency
+        return max(1, min(concurrency, num_recipients))
+    
+    def _send_worker(self, tasks: queue.Queue, retries: DelayedQueue, results: queue.Queue,
+                     bucket: TokenBucket, done: threading.Event,
+                     subject: TemplateParts, body_template: TemplateParts,
+                     skeleton: MIMEMultipart, byte_template: Optional[MessageByteTemplate],
+                     messages_per_connection: int):
+        """
+        Worker loop: pull recipients, send over a private connection and
+        report results. Transient failures are rescheduled on `retries`
+        instead of sleeping, so the worker moves on to the next recipient.
+        """
+        connection = SMTPConnection(self, messages_per_connection)
+        
+        try:
+            while not done.is_set():
+                retry = retries.pop_ready()
+                
+                if retry is not None:
+                    recipient_email, msg, attempt = retry
+                else:
+                    try:
+                        recipient = tasks.get(timeout=RETRY_POLL_INTERVAL)
+                    except queue.Empty:
+                        continue
+                    
+                    recipient_email = recipient.get('email', 'Unknown')
+                    msg = self._message_for(recipient, subject, body_template,
+                                            skeleton, byte_template)
+                    attempt = 0
+                    if not msg:
+                        results.put((recipient_email, False))
+                        continue
+                
+                try:
+                    bucket.acquire()
+                    sent, error = self._attempt_send(connection, msg, recipient_email)
+                except Exception as e:
+                    self.logger.error(f"Worker error for {recipient_email}: {str(e)}")
+                    sent, error = False, None
+                
+                if error is None:
+                    results.put((recipient_email, sent))
+                elif attempt < MAX_RETRIES - 1:
+                    wait_time = _backoff_delay(attempt)
+                    self.logger.warning(
+                        f"Attempt {attempt + 1}/{MAX_RETRIES} failed for {recipient_email}. "
+                        f"Rescheduled in {wait_time:.1f} seconds... Error: {str(error)}"
+                    )
+                    retries.put((recipient_email, msg, attempt + 1), wait_time)
+                else:
+                    self.logger.error(
+                        f"Failed to send to {recipient_email} after {MAX_RETRIES} attempts. "
+                        f"Error: {str(error)}"
+                    )
+                    results.put((recipient_email, False))
+        finally:
+            connection.close()
+    
     def generate_report(self, stats: Dict, output_file: str = None):
         """Generate and save a send report."""
         report = [
@@ -10,6 +10,7 @@ class CSVCreator:
     
     def __init__(self):
         self.filename = "recipients.csv"
+        self.preview_records = 20  # Records shown by view_current_csv
         
     def show_menu(self):
         """Display main menu"""
@@ -140,53 +141,78 @@ class CSVCreator:
         departments = ["Engineering", "Marketing", "Sales", "HR", "Finance", 
                       "IT Support", "Operations", "Research & Development"]
         
-        # Create data
-        data = [["email", "name", "company", "department", "join_date"]]
-        
         print(f"\nGenerating {num_records} records...")
         
-        for i in range(1, num_records + 1):
-            first = random.choice(first_names)
-            last = random.choice(last_names)
-            company = random.choice(companies)
-            dept = random.choice(departments)
-            domain = random.choice(domains)
-            
-            # Create email (different formats)
-            email_format = random.choice([1, 2, 3])
-            if email_format == 1:
-                email = f"{first.lower()}.{last.lower()}@{domain}"
-            elif email_format == 2:
-                email = f"{first[0].lower()}{last.lower()}@{domain}"
-            else:
-                email = f"{first.lower()}{random.randint(1,99)}@{domain}"
-            
-            name = f"{first} {last}"
-            
-            # Random join date
-            year = random.randint(2018, 2023)
-            month = random.randint(1, 12)
-            day = random.randint(1, 28)
-            join_date = f"{year}-{month:02d}-{day:02d}"
-            
-            data.append([email, name, company, dept, join_date])
-            
-            # Show progress for large files
-            if num_records > 50 and i % (num_records // 10) == 0:
-                print(f"  Generated {i}/{num_records} records...")
+        rows = self.generate_large_rows(num_records, first_names, last_names,
+                                        companies, domains, departments)
+        return self.save_csv(rows, f"Large CSV with {num_records} records created!")
+    
+    def generate_large_rows(self, num_records, first_names, last_names,
+                            companies, domains, departments, batch_size=10000):
+        """Yield the header and then random records, one row at a time"""
+        yield ["email", "name", "company", "department", "join_date"]
         
-        return self.save_csv(data, f"Large CSV with {num_records} records created!")
+        lower = {name: name.lower() for name in first_names + last_names}
+        progress_step = num_records // 10 if num_records > 50 else 0
+        
+        for start in range(0, num_records, batch_size):
+            # Draw a batch of random values up front, one call per column
+            k = min(batch_size, num_records - start)
+            firsts = random.choices(first_names, k=k)
+            lasts = random.choices(last_names, k=k)
+            picked_companies = random.choices(companies, k=k)
+            depts = random.choices(departments, k=k)
+            picked_domains = random.choices(domains, k=k)
+            email_formats = random.choices([1, 2, 3], k=k)
+            numbers = random.choices(range(1, 100), k=k)
+            years = random.choices(range(2018, 2024), k=k)
+            months = random.choices(range(1, 13), k=k)
+            days = random.choices(range(1, 29), k=k)
+            
+            for i in range(k):
+                first = firsts[i]
+                last = lasts[i]
+                domain = picked_domains[i]
+                
+                # Create email (different formats)
+                email_format = email_formats[i]
+                if email_format == 1:
+                    email = f"{lower[first]}.{lower[last]}@{domain}"
+                elif email_format == 2:
+                    email = f"{lower[first][0]}{lower[last]}@{domain}"
+                else:
+                    email = f"{lower[first]}{numbers[i]}@{domain}"
+                
+                name = f"{first} {last}"
+                
+                # Random join date
+                join_date = f"{years[i]}-{months[i]:02d}-{days[i]:02d}"
+                
+                yield [email, name, picked_companies[i], depts[i], join_date]
+                
+                # Show progress for large files
+                done = start + i + 1
+                if progress_step and done % progress_step == 0:
+                    print(f"  Generated {done}/{num_records} records...")
     
     def save_csv(self, data, success_message):
-        """Save data to CSV file"""
+        """Save rows (header first) to CSV file, writing them as they are produced"""
         try:
-            with open(self.filename, 'w', newline='', encoding='utf-8') as file:
+            preview = []
+            num_rows = 0
+            
+            with open(self.filename, 'w', newline='', encoding='utf-8',
+                      buffering=1 << 20) as file:
                 writer = csv.writer(file)
-                writer.writerows(data)
+                for row in data:
+                    writer.writerow(row)
+                    if num_rows < 6:  # Keep header + 5 records for the preview
+                        preview.append(row)
+                    num_rows += 1
             
             # Get file info
             file_size = os.path.getsize(self.filename)
-            num_records = len(data) - 1  # Exclude header
+            num_records = max(num_rows - 1, 0)  # Exclude header
             
             print(f"\n {success_message}")
             print(f" File: {self.filename}")
@@ -197,14 +223,14 @@ class CSVCreator:
             # Show preview
             print("\n DATA PREVIEW (first 5 records):")
             print("-" * 60)
-            for i, row in enumerate(data[:6]):  # Show header + 5 records
+            for i, row in enumerate(preview):
                 if i == 0:
                     print(f"Headers: {row}")
                 else:
                     print(f"Row {i}: {row}")
             
-            if len(data) > 6:
-                print(f"... and {len(data)-6} more records")
+            if num_rows > 6:
+                print(f"... and {num_rows-6} more records")
             
             return True
             
@@ -220,16 +246,23 @@ class CSVCreator:
         
         try:
             with open(self.filename, 'r', encoding='utf-8') as file:
-                content = file.read()
+                print(f"\n📄 CONTENTS OF {self.filename}:")
+                print("="*60)
+                
+                # Print the header and first records, then just count the rest
+                num_lines = 0
+                for num_lines, line in enumerate(file, 1):
+                    print(line.rstrip('\r\n'))
+                    if num_lines > self.preview_records:
+                        break
+                
+                remaining = sum(1 for line in file if line.strip())
             
-            print(f"\n📄 CONTENTS OF {self.filename}:")
-            print("="*60)
-            print(content)
+            if remaining:
+                print(f"... and {remaining} more records")
             print("="*60)
             
-            # Count lines
-            lines = content.strip().split('\n')
-            print(f"Total records: {len(lines)-1} (excluding header)")
+            print(f"Total records: {max(num_lines + remaining - 1, 0)} (excluding header)")
             
             return True
             